@@ -21,3 +21,8 @@ TRIAL_PROGRESS_OUTPUT_PATH: Path = Path(
 GPU_TRIALS_LIMIT: int = config.get("gpu_trials_limit", 3)
 CPU_TRIALS_LIMIT: int = config.get("cpu_trials_limit", 1)
 MUTATION_COOLDOWN: int = config.get("mutation_cooldown", 3)
+# 至少為 1, 避免設定為 0 時在計算更新間隔時除以零
+TRIAL_PROGRESS_REFRESH_INTERVAL: int = max(
+    1,
+    int(config.get("trial_progress_refresh_interval", 8)),
+)
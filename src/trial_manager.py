@@ -4,14 +4,23 @@ import math
 import random
 from datetime import UTC, datetime, timedelta
 from pathlib import Path
+from threading import Lock
 
 import ray
+from ray import ObjectRef
 
 from .config import (
     TRIAL_PROGRESS_OUTPUT_PATH,
+    TRIAL_PROGRESS_REFRESH_INTERVAL,
 )
 from .trial_state import PartialTrialState, TrialState
-from .utils import TrialStatus, WorkerState, WorkerType, colored_progress_bar
+from .utils import (
+    Hyperparameter,
+    TrialStatus,
+    WorkerState,
+    WorkerType,
+    colored_progress_bar,
+)
 
 ALLOWED_TRANSITION: dict[TrialStatus, set[TrialStatus]] = {
     TrialStatus.PENDING: {TrialStatus.WAITING},
@@ -59,7 +68,12 @@ class TrialManager:
         trial_states: list[TrialState],
     ) -> None:
         self.all_trials = {trial.id: trial for trial in trial_states}
-        self.pending_ids = {trial.id for trial in trial_states}
+        self.pending_ids: set[int] = set()
+        # 依 generation 分桶的 pending 索引, 避免每次分配都全表掃描
+        # actor 為多執行緒, pending_ids 與分桶索引皆需在 _pending_lock 下存取
+        self._pending_by_generation: dict[int, set[int]] = {}
+        self._pending_generation: dict[int, int] = {}
+        self._pending_lock = Lock()
         self.running_ids = set()
         self.completed_ids = set()
         self.waiting_ids = set()
@@ -68,8 +82,40 @@ class TrialManager:
 
         self._mutation_baseline: float = 0.0
         self._upper_quantile_trials: list[TrialState] = []
+        self._update_count: int = 0
         self.logger = get_trial_manager_logger()
 
+        for trial in trial_states:
+            self._add_pending(trial.id)
+
+    def _add_pending(self, trial_id: int) -> None:
+        with self._pending_lock:
+            self._add_pending_locked(trial_id)
+
+    def _discard_pending(self, trial_id: int) -> None:
+        with self._pending_lock:
+            self._discard_pending_locked(trial_id)
+
+    def _add_pending_locked(self, trial_id: int) -> None:
+        generation = self.all_trials[trial_id].generation
+        self.pending_ids.add(trial_id)
+        self._pending_by_generation.setdefault(generation, set()).add(trial_id)
+        self._pending_generation[trial_id] = generation
+
+    def _discard_pending_locked(self, trial_id: int) -> None:
+        generation = self._pending_generation.pop(trial_id, None)
+        self.pending_ids.discard(trial_id)
+        if generation is None:
+            return
+
+        bucket = self._pending_by_generation.get(generation)
+        if bucket is None:
+            return
+
+        bucket.discard(trial_id)
+        if not bucket:
+            del self._pending_by_generation[generation]
+
     def set_worker_states(self, worker_states: list[WorkerState]) -> None:
         self.worker_states = worker_states
 
@@ -106,7 +152,7 @@ class TrialManager:
             self.update_trial(trial_id, partial)
 
         self._set_status(trial_id, TrialStatus.WAITING)
-        self.pending_ids.discard(trial_id)
+        self._discard_pending(trial_id)
         self.waiting_ids.add(trial_id)
 
     def _transition_to_running(
@@ -135,7 +181,7 @@ class TrialManager:
 
         self._set_status(trial_id, TrialStatus.PENDING)
         self.running_ids.discard(trial_id)
-        self.pending_ids.add(trial_id)
+        self._add_pending(trial_id)
 
     def _transition_to_completed(
         self,
@@ -145,11 +191,13 @@ class TrialManager:
         self._get_trial_or_raise(trial_id)
 
         if partial:
-            self.update_trial(trial_id, partial)
+            # 完成時會在狀態更新後強制輸出進度表, 這裡不需要再寫一次
+            self.update_trial(trial_id, partial, refresh_progress=False)
 
         self._set_status(trial_id, TrialStatus.TERMINATED)
         self.running_ids.discard(trial_id)
         self.completed_ids.add(trial_id)
+        self.display_trial_result()
 
     def transition_status(
         self,
@@ -170,6 +218,24 @@ class TrialManager:
                 msg = f"Unknown status: {status}"
                 raise ValueError(msg)
 
+    def terminate_trial(
+        self,
+        trial_id: int,
+        partial: PartialTrialState | None = None,
+    ) -> bool:
+        """
+        將 Trial 轉為 TERMINATED, 並回傳是否所有 Trial 皆已完成。
+
+        Args:
+            trial_id (int): 試驗 ID。
+            partial (PartialTrialState | None): 要一併更新的部分狀態。
+
+        Returns:
+            bool: 所有 Trial 是否皆已完成。
+        """
+        self._transition_to_completed(trial_id, partial)
+        return self.is_finish()
+
     def acquire_pending_trials(
         self,
         worker_id: int,
@@ -178,7 +244,10 @@ class TrialManager:
     ) -> list[TrialState]:
         acquired = []
 
-        for trial_id in list(self.pending_ids)[:n]:
+        with self._pending_lock:
+            trial_ids = list(self.pending_ids)[:n]
+
+        for trial_id in trial_ids:
             trial = self.all_trials[trial_id]
             acquired.append(trial)
             self._transition_to_waiting(
@@ -188,6 +257,25 @@ class TrialManager:
 
         return acquired
 
+    def acquire_pending_trials_batch(
+        self,
+        requests: list[tuple[int, int, WorkerType]],
+    ) -> dict[int, list[TrialState]]:
+        """
+        一次處理多個 worker 的初始 Trial 分配, 避免每個 worker 各自來回一次。
+
+        Args:
+            requests (list[tuple[int, int, WorkerType]]):
+                (worker_id, 數量, worker 類型) 的列表。
+
+        Returns:
+            dict[int, list[TrialState]]: worker_id 對應分配到的 Trial 列表。
+        """
+        return {
+            worker_id: self.acquire_pending_trials(worker_id, n, worker_type)
+            for worker_id, n, worker_type in requests
+        }
+
     def acquire_pending_trial_for_gpu(
         self,
         worker_id: int,
@@ -216,9 +304,10 @@ class TrialManager:
         if current_trial_state.status != TrialStatus.PENDING:
             self.logger.info(
                 "Trial %d is no longer PENDING "
-                "(current status: {current_trial_state.status}). "
+                "(current status: %s). "
                 "Skipping acquisition.",
                 current_trial_state.id,
+                current_trial_state.status,
             )
             return None
 
@@ -242,7 +331,11 @@ class TrialManager:
         if not self.pending_ids:
             return None
 
-        selected_trial = self.get_nlargest_iteration_trials(k)[-1]  # type: ignore[reportGeneralTypeIssues]
+        trials = self.get_nlargest_iteration_trials(k)
+        if not trials:
+            return None
+
+        selected_trial = trials[-1]
         selected_trial.set_target_generation(2)
         self._transition_to_waiting(
             selected_trial.id,
@@ -252,58 +345,61 @@ class TrialManager:
         return selected_trial
 
     def get_pending_trials(self) -> list[TrialState]:
-        return [self.all_trials[tid] for tid in self.pending_ids]
+        with self._pending_lock:
+            return [self.all_trials[tid] for tid in self.pending_ids]
 
     def get_pending_trials_with_min_iteration(self) -> list[TrialState]:
-        if not self.pending_ids:
-            return []
+        with self._pending_lock:
+            if not self._pending_by_generation:
+                return []
 
-        pending_trials = self.get_pending_trials()
-        min_iter = min(pending_trials, key=lambda t: t.generation).generation
-        return [trial for trial in pending_trials if trial.generation == min_iter]
+            min_iter = min(self._pending_by_generation)
+            return [
+                self.all_trials[tid]
+                for tid in self._pending_by_generation.get(min_iter, ())
+            ]
 
     def get_least_iterated_pending_trial(self) -> TrialState | None:
-        if not self.pending_ids:
-            return None
+        with self._pending_lock:
+            if not self._pending_by_generation:
+                return None
 
-        return min(
-            (self.all_trials[tid] for tid in self.pending_ids),
-            key=lambda t: t.generation,
-            default=None,
-        )
+            min_iter = min(self._pending_by_generation)
+            trial_id = next(iter(self._pending_by_generation.get(min_iter, ())), None)
+            return None if trial_id is None else self.all_trials[trial_id]
 
     def get_most_iterated_pending_trial(self) -> TrialState | None:
-        if not self.pending_ids:
-            return None
+        with self._pending_lock:
+            if not self._pending_by_generation:
+                return None
 
-        return max(
-            (self.all_trials[tid] for tid in self.pending_ids),
-            key=lambda t: t.generation,
-            default=None,
-        )
+            max_iter = max(self._pending_by_generation)
+            trial_id = next(iter(self._pending_by_generation.get(max_iter, ())), None)
+            return None if trial_id is None else self.all_trials[trial_id]
 
     def compute_target_generation(self, generation: int) -> int:
-        generations = sorted(
-            [trial.generation for trial in self.all_trials.values()],
-            reverse=True,
+        length = (len(self.all_trials) // 4) + 1
+        generations = heapq.nlargest(
+            length,
+            (trial.generation for trial in self.all_trials.values()),
         )
-        length = (len(generations) // 4) + 1
-        target_generation = sum(generations[:length]) // length - generation + 1
+        target_generation = sum(generations) // length - generation + 1
         return max(target_generation, 1)
 
     def get_history_best_result(self) -> TrialState | None:
         return self.history_best
 
     def get_nlargest_iteration_trials(self, k: int) -> list[TrialState]:
-        return heapq.nlargest(
-            k,
-            [
-                trial
-                for trial in self.all_trials.values()
-                if trial.id in self.pending_ids
-            ],
-            key=lambda t: t.generation,
-        )
+        result: list[TrialState] = []
+
+        with self._pending_lock:
+            for generation in sorted(self._pending_by_generation, reverse=True):
+                for trial_id in self._pending_by_generation.get(generation, ()):
+                    if len(result) >= k:
+                        return result
+                    result.append(self.all_trials[trial_id])
+
+        return result
 
     def get_mutation_baseline(
         self,
@@ -349,12 +445,33 @@ class TrialManager:
         self._mutation_baseline = self.get_mutation_baseline()
         self._upper_quantile_trials = self.get_upper_quantile_trials()
 
-    def update_trial(self, trial_id: int, partial: PartialTrialState) -> None:
+    def update_trial(
+        self,
+        trial_id: int,
+        partial: PartialTrialState,
+        *,
+        refresh_progress: bool = True,
+    ) -> None:
         trial_state = self._get_trial_or_raise(trial_id)
 
+        # Worker 以 ObjectRef 傳遞 checkpoint, 讓 Tuner 轉送時不需取回內容
+        checkpoint = partial.get("checkpoint")
+        if isinstance(checkpoint, ObjectRef):
+            partial["checkpoint"] = ray.get(checkpoint)
+
         old_checkpoint_location = trial_state.last_checkpoint_location
 
-        trial_state.update_partial(partial)
+        # pending 中的 Trial 若 generation 改變, 需在同一把鎖內重新放入對應的分桶
+        with self._pending_lock:
+            trial_state.update_partial(partial)
+
+            if (
+                "generation" in partial
+                and trial_id in self.pending_ids
+                and self._pending_generation.get(trial_id) != trial_state.generation
+            ):
+                self._discard_pending_locked(trial_id)
+                self._add_pending_locked(trial_id)
 
         if (
             not old_checkpoint_location.is_empty()
@@ -386,11 +503,18 @@ class TrialManager:
                 self.logger.info(
                     "History best accuracy: %f, %s, iteration: %d",
                     self.history_best.accuracy,
-                    str(self.history_best.hyperparameter),
+                    self.history_best.hyperparameter,
                     self.history_best.generation,
                 )
             self.maybe_update_mutation_baseline()
-        self.display_trial_result()
+
+        # 進度表每次都會重寫整個檔案, 只在每 N 次更新時輸出一次
+        self._update_count += 1
+        if (
+            refresh_progress
+            and self._update_count % TRIAL_PROGRESS_REFRESH_INTERVAL == 0
+        ):
+            self.display_trial_result()
 
     def is_finish(self) -> bool:
         self.logger.info(
@@ -430,6 +554,32 @@ class TrialManager:
             "checkpoint": chose_trial.checkpoint,
         }
 
+    def mutate_trial(
+        self,
+        trial_id: int,
+        partial: PartialTrialState,
+    ) -> Hyperparameter:
+        """
+        對 Trial 執行 mutation 並放回 pending。
+
+        mutation 選出的 checkpoint 直接在 TrialManager 內套用,
+        不需經過 Tuner 來回傳遞。
+
+        Args:
+            trial_id (int): 試驗 ID。
+            partial (PartialTrialState): worker 回報的部分狀態。
+
+        Returns:
+            Hyperparameter: mutation 後的新超參數。
+        """
+        mutation_partial = self.mutation()
+
+        # bs_list = [32, 64, 128]
+        # mutation_partial["hyperparameter"].batch_size = bs_list[trial_id % len(bs_list)]
+
+        self._transition_to_pending(trial_id, partial | mutation_partial)
+        return mutation_partial["hyperparameter"]
+
     def _worker_type_to_str(self, worker_type: WorkerType | None) -> str:
         match worker_type:
             case WorkerType.CPU:
@@ -546,6 +696,8 @@ class TrialManager:
             print(f"Error writing trial results: {e}")
 
     def print_iteration_count(self) -> None:
+        self.display_trial_result()
+
         iteration_counts = [
             (i.id, i.device_iteration_count) for i in self.all_trials.values()
         ]
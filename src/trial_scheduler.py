@@ -1,4 +1,5 @@
 import logging
+import random
 from datetime import UTC, datetime, timedelta
 from pathlib import Path
 from threading import Event
@@ -19,19 +20,15 @@ def gpu_scheduling(
     worker_manager: WorkerManager,
     logger: logging.Logger,
 ) -> None:
-    # 若沒有任何 pending 的 Trial,結束
-    if not ray.get(trial_manager.has_pending_trials.remote()):  # type: ignore[reportGeneralTypeIssues]
-        logger.info("沒有待分配的 Trial")
-        return
-
     worker_entry = worker_manager.gpu_workers[worker_id]
 
+    # 沒有 pending 的 Trial 時 acquire 會回傳 None, 不需要再另外詢問一次
     selected_trial = ray.get(
         trial_manager.acquire_pending_trial_for_gpu.remote(worker_id),  # type: ignore[reportGeneralTypeIssues]
     )
 
     if selected_trial is None:
-        logger.info(f"Worker {worker_id} did not acquire a pending GPU trial.")
+        logger.info("Worker %d did not acquire a pending GPU trial.", worker_id)
         return
 
     worker_manager.assign_trial_to_worker(
@@ -46,10 +43,6 @@ def cpu_scheduling(
     worker_manager: WorkerManager,
     logger: logging.Logger,
 ) -> None:
-    if not ray.get(trial_manager.has_pending_trials.remote()):  # type: ignore[reportGeneralTypeIssues]
-        logger.info("沒有待分配的 Trial")
-        return
-
     worker_entry = worker_manager.cpu_workers[worker_id]
 
     target_trial = ray.get(
@@ -59,6 +52,10 @@ def cpu_scheduling(
         ),
     )
 
+    if target_trial is None:
+        logger.info("沒有待分配的 Trial")
+        return
+
     worker_manager.assign_trial_to_worker(
         worker_entry.id,
         target_trial,
@@ -72,18 +69,29 @@ def stealing_strategy(
     interrupted_record_set: set[tuple[int, int]],
 ) -> None:
     logger.info("嘗試從 CPU Worker 偷取任務")
-    running_workers = (
+    running_workers = [
         worker_entry
         for worker_entry in worker_manager.cpu_workers.values()
         if worker_entry.available_slots == 0
-    )
+    ]
 
-    worker = next(running_workers, None)
-    if worker is None:
+    if not running_workers:
         logger.info("沒有可用的 CPU Worker 來偷取任務")
         return
 
-    trial_id = worker.active_trials[0]
+    # 候選 Worker 皆為滿載 (持有 CPU_TRIALS_LIMIT 個 Trial), 佇列長度相同,
+    # 因此不依負載挑選, 只挑分配時 generation 最舊的 Trial, 讓落後的 Trial 交給 GPU。
+    # Worker 會先訓練 generation 最小的 Trial, 因此被選中的通常正在或即將執行。
+    # 同分者隨機挑選, 避免總是偷同一台
+    candidates = [
+        (entry.trial_generations.get(trial_id, 0), entry, trial_id)
+        for entry in running_workers
+        for trial_id in entry.active_trials
+    ]
+    min_generation = min(generation for generation, _, _ in candidates)
+    _, worker, trial_id = random.choice(
+        [candidate for candidate in candidates if candidate[0] == min_generation],
+    )
 
     logger.info("嘗試從 CPU Worker %d 偷取 Trial %d", worker.id, trial_id)
     worker.ref.stealing_trial.remote(trial_id)  # type: ignore[reportGeneralTypeIssues])
@@ -166,25 +174,21 @@ class TrialScheduler:
         self.interrupted_record_set: set[tuple[int, int]] = set()
 
     def init_worker_queue(self) -> None:
-        for worker_entry in self.worker_manager.gpu_workers.values():
-            trials = ray.get(
-                self.trial_manager.acquire_pending_trials.remote(
-                    worker_entry.id,
-                    GPU_TRIALS_LIMIT,
-                    WorkerType.GPU,
-                ),  # type: ignore[reportGeneralTypeIssues]
-            )
-            self.worker_manager.assign_trials_to_worker(worker_entry.id, trials)
-
-        for worker_entry in self.worker_manager.cpu_workers.values():
-            trials = ray.get(
-                self.trial_manager.acquire_pending_trials.remote(
-                    worker_entry.id,
-                    CPU_TRIALS_LIMIT,
-                    WorkerType.CPU,
-                ),  # type: ignore[reportGeneralTypeIssues]
-            )
-            self.worker_manager.assign_trials_to_worker(worker_entry.id, trials)
+        # GPU worker 先取, 保持與逐一分配時相同的優先順序
+        requests = [
+            (worker_id, GPU_TRIALS_LIMIT, WorkerType.GPU)
+            for worker_id in self.worker_manager.gpu_workers
+        ] + [
+            (worker_id, CPU_TRIALS_LIMIT, WorkerType.CPU)
+            for worker_id in self.worker_manager.cpu_workers
+        ]
+
+        acquired = ray.get(
+            self.trial_manager.acquire_pending_trials_batch.remote(requests),  # type: ignore[reportGeneralTypeIssues]
+        )
+
+        for worker_id, trials in acquired.items():
+            self.worker_manager.assign_trials_to_worker(worker_id, trials)
 
     def assign_trial_to_worker(self, worker_id: int, worker_type: WorkerType) -> None:  # type: ignore[reportGeneralTypeIssues]
         """
@@ -4,6 +4,7 @@ from typing import TypedDict
 
 import ray
 import torch
+from ray import ObjectRef
 from torch import nn, optim
 
 from .config import (
@@ -41,7 +42,8 @@ class PartialTrialState(TypedDict, total=False):
 
     Attributes:
         accuracy (float): 該 trial 的當前準確率 (accuracy)。
-        checkpoint (Checkpoint): 儲存當前模型或訓練進度的 Checkpoint。
+        checkpoint (Checkpoint | ObjectRef): 儲存當前模型或訓練進度的 Checkpoint,
+            worker 回報時為 object store 中的參照, 由 TrialManager 取出。
         chunk_size (float): 在資料分批 (batch/chunk) 過程中的大小設定。
         generation (int): 該 trial 所屬的世代 (generation), 用於 PBT 演化流程。
         hyperparameter (Hyperparameter): 該 trial 使用的超參數 (hyperparameters)。
@@ -52,7 +54,7 @@ class PartialTrialState(TypedDict, total=False):
     """
 
     accuracy: float
-    checkpoint: Checkpoint
+    checkpoint: Checkpoint | ObjectRef
     chunk_size: float
     device_iteration_count: dict[WorkerType, int]
     generation: int
@@ -1,5 +1,5 @@
+import io
 import logging
-import os
 import time
 import zipfile
 from datetime import UTC, datetime, timedelta
@@ -127,16 +127,12 @@ class Tuner:
 
         partial["worker_id"] = -1
         partial["worker_type"] = None
-        ray.get(
-            self.trial_manager.transition_status.remote(
-                trial_id,
-                TrialStatus.TERMINATED,
-                partial,
-            ),  # type: ignore[reportGeneralTypeIssues]
+        is_finish = ray.get(
+            self.trial_manager.terminate_trial.remote(trial_id, partial),  # type: ignore[reportGeneralTypeIssues]
         )
         self.worker_manager.release_slots(worker_id, trial_id)
 
-        if ray.get(self.trial_manager.is_finish.remote()):  # type: ignore[reportGeneralTypeIssues]
+        if is_finish:
             self.scheduler.finish()
             return
 
@@ -206,27 +202,19 @@ class Tuner:
         )
 
         self.logger.info("Trial %d: 執行mutation", trial_id)
-        mutation_partial = ray.get(self.trial_manager.mutation.remote())  # type: ignore[reportGeneralTypeIssues]
-
-        # bs_list = [32, 64, 128]
-        # mutation_partial["hyperparameter"].batch_size = bs_list[trial_id % len(bs_list)]
-
-        self.logger.info(
-            "Trial %d 結束mutation, 新超參數: %s",
-            trial_id,
-            mutation_partial["hyperparameter"],
-        )
 
         partial["worker_id"] = -1
         partial["worker_type"] = None
         partial["mutation_cooldown"] = MUTATION_COOLDOWN
 
-        ray.get(
-            self.trial_manager.transition_status.remote(  # type: ignore[reportGeneralTypeIssues]
-                trial_id,
-                TrialStatus.PENDING,
-                partial | mutation_partial,
-            ),
+        hyperparameter = ray.get(
+            self.trial_manager.mutate_trial.remote(trial_id, partial),  # type: ignore[reportGeneralTypeIssues]
+        )
+
+        self.logger.info(
+            "Trial %d 結束mutation, 新超參數: %s",
+            trial_id,
+            hyperparameter,
         )
 
         self.worker_manager.release_slots(worker_id, trial_id)
@@ -249,18 +237,22 @@ class Tuner:
         with (log_dir / "trial_scheduler.log").open("w") as f:
             f.write(trial_scheduler_log_content)
 
-        # Get worker log files
-        for worker_entry in self.worker_manager.workers.values():
-            worker = worker_entry.ref
+        # 同時向所有 worker 與 trial manager 要求日誌
+        trial_manager_log_future = self.trial_manager.get_log_file.remote()  # type: ignore[reportGeneralTypeIssues]
+        pending_worker_logs = [
+            worker_entry.ref.get_log_file.remote()  # type: ignore[reportGeneralTypeIssues]
+            for worker_entry in self.worker_manager.workers.values()
+        ]
 
-            future = ray.get(worker.get_log_file.remote())  # type: ignore[reportGeneralTypeIssues]
-            with (Path(log_dir) / f"worker-{future['id']}.log").open("w") as f:
-                f.write(future["content"])
+        # Get worker log files, 先回應的 worker 先寫入, 不必等待最慢的 worker
+        while pending_worker_logs:
+            ready, pending_worker_logs = ray.wait(pending_worker_logs, num_returns=1)
+            worker_log = ray.get(ready[0])
+            with (Path(log_dir) / f"worker-{worker_log['id']}.log").open("w") as f:
+                f.write(worker_log["content"])
 
         # Get trial manager log file
-        trial_manager_log_content = ray.get(
-            self.trial_manager.get_log_file.remote(),  # type: ignore[reportGeneralTypeIssues]
-        )
+        trial_manager_log_content = ray.get(trial_manager_log_future)
         with (log_dir / "trial_manager.log").open("w") as f:
             f.write(trial_manager_log_content)
 
@@ -269,13 +261,16 @@ class Tuner:
         with (log_dir / "worker_manager.log").open("w") as f:
             f.write(worker_manager_log_content)
 
-        zip_path = "./logs.zip"
-        with zipfile.ZipFile(zip_path, "w", zipfile.ZIP_DEFLATED) as zf:
-            for root, _, files in os.walk(log_dir):
-                for file in files:
-                    abs_file = Path(root) / file
-                    rel_path = os.path.relpath(abs_file, log_dir)
-                    zf.write(abs_file, arcname=rel_path)
-
-        with Path(zip_path).open("rb") as f:
-            return f.read()
+        # 直接在記憶體中壓縮, 日誌為純文字, 較低的壓縮等級即可取得接近的壓縮率
+        buffer = io.BytesIO()
+        with zipfile.ZipFile(
+            buffer,
+            "w",
+            zipfile.ZIP_DEFLATED,
+            compresslevel=3,
+        ) as zf:
+            for path in log_dir.rglob("*"):
+                if path.is_file():
+                    zf.writestr(str(path.relative_to(log_dir)), path.read_bytes())
+
+        return buffer.getvalue()
@@ -1,9 +1,11 @@
 import logging
 import random
 from pathlib import Path
+from threading import Event
 
 import ray
 import torch
+from ray import ObjectRef
 from ray.actor import ActorHandle
 from torch import nn, optim
 from torch.utils.data import DataLoader
@@ -129,7 +131,10 @@ class Worker:
         self.iteration_per_generation: int = ITERATION_PER_GENERATION
         self.interrupt_set: set = set()
         self.is_stop: bool = False
+        self._trial_event = Event()
         self.saved_checkpoint: dict[int, Checkpoint] = {}
+        self._baseline_future: ObjectRef | None = None
+        self._mutation_baseline: float = 0.0
         self.logger.info("初始化完成")
 
         torch.set_num_threads(int(self.worker_state.num_cpus))
@@ -180,9 +185,30 @@ class Worker:
         """
         if trial_id in self.saved_checkpoint:
             self.saved_checkpoint.pop(trial_id)
-            self.log("info", f"已移除 Trial {trial_id} 的檢查點", trial_id=trial_id)
+            self.log("info", "已移除 Trial %d 的檢查點", trial_id, trial_id=trial_id)
         else:
-            self.log("warning", f"Trial {trial_id} 的檢查點不存在", trial_id=trial_id)
+            self.log("warning", "Trial %d 的檢查點不存在", trial_id, trial_id=trial_id)
+
+    def _get_mutation_baseline(self) -> float:
+        """
+        以非阻塞方式取得 mutation baseline。
+
+        每次只保留一個向 TrialManager 查詢的 future, 完成時更新快取並送出下一次查詢;
+        尚未完成時直接使用上一次的快取值, 避免每個世代都阻塞等待 TrialManager。
+
+        Returns:
+            float: 目前快取的 mutation baseline。
+        """
+        if self._baseline_future is not None:
+            ready, _ = ray.wait([self._baseline_future], timeout=0)
+            if not ready:
+                return self._mutation_baseline
+            self._mutation_baseline = ray.get(self._baseline_future)
+
+        self._baseline_future = (
+            self.trial_manager.get_cached_mutation_baseline.remote()  # type: ignore[reportGeneralTypeIssues]
+        )
+        return self._mutation_baseline
 
     @timer()
     def _trial_load_checkpoint(self, trial_state: TrialState) -> None:
@@ -258,13 +284,17 @@ class Worker:
         self.save_checkpoint(trial_state)
         trial_state.update_worker_state(self.worker_state)
         self.active_trials[trial_state.id] = trial_state
+        self._trial_event.set()
 
     def init_trial_queue(self, trials: list[TrialState]) -> None:
         for trial_state in trials:
             self.active_trials[trial_state.id] = trial_state
+        self._trial_event.set()
 
     def run(self) -> None:
         while not self.is_stop:
+            # 先清除再檢查, 確保檢查後才到達的 Trial 仍會喚醒等待
+            self._trial_event.clear()
             trial_state = min(
                 self.active_trials.values(),
                 key=lambda x: x.generation,
@@ -272,6 +302,7 @@ class Worker:
             )
 
             if trial_state is None:
+                self._trial_event.wait()
                 continue
 
             ray.get(
@@ -288,7 +319,8 @@ class Worker:
 
             self.log(
                 "info",
-                f"開始訓練, target_generation: {trial_state.target_generation}",
+                "開始訓練, target_generation: %s",
+                trial_state.target_generation,
                 trial_id=trial_state.id,
             )
 
@@ -330,32 +362,42 @@ class Worker:
 
         self.log(
             "info",
-            f"更新世代數: {target_generation}, 每世代迭代次數: {iterations}",
+            "更新世代數: %d, 每世代迭代次數: %d",
+            target_generation,
+            iterations,
             trial_id=trial_state.id,
         )
 
+        # 迴圈內反覆使用的屬性先綁定為區域變數
+        # interrupt_set 只會被原地修改, 因此別名仍能看到 stealing_trial 的更新
+        trial_id = trial_state.id
+        interrupt_set = self.interrupt_set
+        train_step = self.strategy.train_step
+        device = self.device
+        worker_type = self.worker_state.worker_type
+
         # ───────────────────────────── 開始執行訓練 ─────────────────────────────
         for _ in range(target_generation):
             for _ in range(iterations):
                 if trial_state.generation >= trial_state.max_generation:
                     break
 
-                if trial_state.id in self.interrupt_set:
+                if trial_id in interrupt_set:
                     return
 
-                self.strategy.train_step(
+                train_step(
                     model,
                     optimizer,
                     train_loader,
-                    self.device,
+                    device,
                 )
 
                 if trial_state.mutation_cooldown:
                     trial_state.mutation_cooldown -= 1
 
-            trial_state.device_iteration_count[self.worker_state.worker_type] += 1
+            trial_state.device_iteration_count[worker_type] += 1
 
-            if trial_state.id in self.interrupt_set:
+            if trial_id in interrupt_set:
                 return
 
             trial_state.generation += 1
@@ -370,7 +412,9 @@ class Worker:
 
         self.log(
             "info",
-            f"Generation: {trial_state.generation} Accuracy: {trial_state.accuracy}",
+            "Generation: %d Accuracy: %s",
+            trial_state.generation,
+            trial_state.accuracy,
             trial_id=trial_state.id,
         )
 
@@ -386,23 +430,26 @@ class Worker:
                 {
                     "accuracy": trial_state.accuracy,
                     "generation": trial_state.generation,
-                    "checkpoint": trial_state.checkpoint,
+                    "checkpoint": ray.put(trial_state.checkpoint),
                     "device_iteration_count": trial_state.device_iteration_count,
                 },
             )
             return
 
-        baseline = ray.get(self.trial_manager.get_mutation_baseline.remote())  # type: ignore[reportGeneralTypeIssues]
+        baseline = self._get_mutation_baseline()
 
         if trial_state.mutation_cooldown <= 0:
             self.log(
                 "info",
-                f"Skip mutation, cooldown remaining: {trial_state.mutation_cooldown}",
+                "Skip mutation, cooldown remaining: %d",
+                trial_state.mutation_cooldown,
             )
         if trial_state.mutation_cooldown > 0 and trial_state.accuracy <= baseline:
             self.log(
                 "info",
-                f"Baseline: {baseline}, Accuracy: {trial_state.accuracy}",
+                "Baseline: %s, Accuracy: %s",
+                baseline,
+                trial_state.accuracy,
                 trial_id=trial_state.id,
             )
             trial_state.update_checkpoint(model, optimizer)
@@ -419,17 +466,8 @@ class Worker:
             # self.pop_checkpoint(trial_state.id)
             return
 
-        # ── 更新 Trial ────────────────────────────────────────────────────────
-        self.trial_manager.update_trial.remote(
-            trial_state.id,
-            {
-                "accuracy": trial_state.accuracy,
-                "generation": trial_state.generation,
-                "device_iteration_count": trial_state.device_iteration_count,
-            },
-        )
-
         # ── 目標世代數已達成, 更新檢查點並回報結果 ────────────────────────────
+        # accuracy / generation 會隨 on_trial_step_complete 一併交給 TrialManager 更新
         trial_state.update_checkpoint(model, optimizer)
         self.tuner.on_trial_step_complete.remote(
             self.worker_state.id,
@@ -438,7 +476,7 @@ class Worker:
             {
                 "accuracy": trial_state.accuracy,
                 "generation": trial_state.generation,
-                "checkpoint": trial_state.checkpoint,
+                "checkpoint": ray.put(trial_state.checkpoint),
                 "device_iteration_count": trial_state.device_iteration_count,
             },
         )
@@ -463,31 +501,39 @@ class Worker:
         with Path(log_dir).open("r") as f:
             return {"id": self.worker_state.id, "content": f.read()}
 
-    def log(self, level: str, message: str, trial_id: int | str = "N/A") -> None:
+    def log(
+        self,
+        level: str,
+        message: str,
+        *args: object,
+        trial_id: int | str = "N/A",
+    ) -> None:
         """
         根據指定的 log 級別輸出訊息。
 
         Args:
             level (str): 記錄等級 (info/debug/warning/error/critical) 。
-            message (str): 要記錄的訊息。
+            message (str): 要記錄的訊息, 可包含 %-格式的佔位符。
+            *args (object): 格式化參數, 僅在該級別啟用時才會套用。
             trial_id (Union[int, str], optional): 試驗 ID。預設為 "N/A"。
         """
         extra = {"trial_id": trial_id}
         if level == "info":
-            self.logger.info(message, extra=extra)
+            self.logger.info(message, *args, extra=extra)
             return
         if level == "debug":
-            self.logger.debug(message, extra=extra)
+            self.logger.debug(message, *args, extra=extra)
             return
         if level == "warning":
-            self.logger.warning(message, extra=extra)
+            self.logger.warning(message, *args, extra=extra)
             return
         if level == "critical":
-            self.logger.critical(message, extra=extra)
+            self.logger.critical(message, *args, extra=extra)
             return
         if level == "error":
-            self.logger.error(message, extra=extra)
+            self.logger.error(message, *args, extra=extra)
             return
 
     def stop(self) -> None:
         self.is_stop = True
+        self._trial_event.set()
@@ -51,6 +51,8 @@ class WorkerEntry:
     state: WorkerState
     ref: ActorHandle
     active_trials: list[int] = field(default_factory=list)
+    # 分配當下各 Trial 的 generation (之後不會更新), 供偷取時挑選 victim, 不需額外 RTT
+    trial_generations: dict[int, int] = field(default_factory=dict)
 
     @property
     def available_slots(self) -> int:
@@ -69,11 +71,16 @@ class WorkerManager:
         strategy: TaskStrategy,
     ) -> None:
         self.workers: dict[int, WorkerEntry] = {}
+        self.cpu_workers: dict[int, WorkerEntry] = {}
+        self.gpu_workers: dict[int, WorkerEntry] = {}
         self.assign_count: dict[str, int] = {"assign": 0, "locality": 0}
         self.logger: logging.Logger = get_worker_manager_logger()
 
         worker_states = generate_all_worker_states()
 
+        # 所有 Worker 共用同一個 strategy, 只序列化一次
+        strategy_ref = ray.put(strategy)
+
         for worker_state in worker_states:
             worker_ref: ActorHandle = Worker.options(  # type: ignore[reportGeneralTypeIssues]
                 max_concurrency=worker_state.max_trials + 3,
@@ -83,25 +90,22 @@ class WorkerManager:
                 resources={worker_state.node_name: 0.01},
             ).remote(
                 worker_state,
-                strategy,
+                strategy_ref,
                 tuner,
                 trial_manager,
             )
 
-            self.workers[worker_state.id] = WorkerEntry(worker_state, worker_ref)
+            worker_entry = WorkerEntry(worker_state, worker_ref)
+            self.workers[worker_state.id] = worker_entry
 
-        self.cpu_workers = {
-            worker_id: worker_entry
-            for worker_id, worker_entry in self.workers.items()
-            if worker_entry.state.worker_type == WorkerType.CPU
-        }
+            match worker_state.worker_type:
+                case WorkerType.CPU:
+                    self.cpu_workers[worker_state.id] = worker_entry
+                case WorkerType.GPU:
+                    self.gpu_workers[worker_state.id] = worker_entry
 
-        self.gpu_workers = {
-            worker_id: worker_entry
-            for worker_id, worker_entry in self.workers.items()
-            if worker_entry.state.worker_type == WorkerType.GPU
-        }
-        [self.workers[worker_id].ref.run.remote() for worker_id in self.workers]
+        for worker_entry in self.workers.values():
+            worker_entry.ref.run.remote()
 
     def get_worker_states(self) -> dict[int, WorkerState]:
         return {entry.id: entry.state for entry in self.workers.values()}
@@ -136,6 +140,7 @@ class WorkerManager:
                 raise ValueError(msg)
 
             entry.active_trials.append(trial.id)
+            entry.trial_generations[trial.id] = trial.generation
         entry.ref.init_trial_queue.remote(trial_states)
 
     def assign_trial_to_worker(
@@ -149,6 +154,7 @@ class WorkerManager:
             raise ValueError(msg)
 
         entry.active_trials.append(trial.id)
+        entry.trial_generations[trial.id] = trial.generation
         self.logger.info(
             "Active trials on Worker %d: %s",
             worker_id,
@@ -178,6 +184,7 @@ class WorkerManager:
             msg = f"Worker {worker_id} 不存在."
             raise ValueError(msg)
 
+        entry.trial_generations.pop(trial_id, None)
         try:
             entry.active_trials.remove(trial_id)
         except ValueError:
@@ -0,0 +1,109 @@
+import os
+import tempfile
+import unittest
+import warnings
+from pathlib import Path
+
+import ray
+
+from src.trial_manager import TrialManager
+from src.trial_state import TrialState
+from src.utils import Hyperparameter
+
+NUM_TRIALS = 8
+# 每個 generation 各有 GROUP_SIZE 個 Trial, generation 為 0 ~ MAX_TEST_GENERATION
+GROUP_SIZE = 2
+MAX_TEST_GENERATION = NUM_TRIALS // GROUP_SIZE - 1
+WORKER_ID = 0
+CPU_WORKER_NUM = 2
+
+
+class TestTrialManagerPendingIndex(unittest.TestCase):
+    """
+    透過 TrialManager actor 的公開方法驗證依 generation 分桶的 pending 索引。
+
+    所有呼叫皆依序送出, 並未測試 _pending_lock 要保護的並行存取。
+    """
+
+    @classmethod
+    def setUpClass(cls) -> None:
+        warnings.simplefilter("ignore", ResourceWarning)
+        # TrialManager 會在工作目錄下建立 logs/, 切到暫存目錄避免污染 repo
+        cls.original_cwd = Path.cwd()
+        cls.temp_dir = tempfile.TemporaryDirectory()
+        os.chdir(cls.temp_dir.name)
+        ray.init(ignore_reinit_error=True)
+
+    @classmethod
+    def tearDownClass(cls) -> None:
+        ray.shutdown()
+        os.chdir(cls.original_cwd)
+        cls.temp_dir.cleanup()
+
+    def setUp(self) -> None:
+        trials = [
+            TrialState(i, Hyperparameter(0.01, 32), generation=i // GROUP_SIZE)
+            for i in range(NUM_TRIALS)
+        ]
+        self.trial_manager = TrialManager.remote(trials)
+
+    def tearDown(self) -> None:
+        ray.kill(self.trial_manager)
+
+    def get_min_iteration_ids(self) -> set[int]:
+        trials = ray.get(
+            self.trial_manager.get_pending_trials_with_min_iteration.remote(),
+        )
+        return {trial.id for trial in trials}
+
+    def test_min_iteration_returns_whole_group(self) -> None:
+        assert self.get_min_iteration_ids() == set(range(GROUP_SIZE))
+
+    def test_nlargest_iteration_trials(self) -> None:
+        k = GROUP_SIZE + 1
+        trials = ray.get(self.trial_manager.get_nlargest_iteration_trials.remote(k))
+        generations = [trial.generation for trial in trials]
+
+        assert len(trials) == k
+        assert generations == sorted(generations, reverse=True)
+        assert generations[0] == MAX_TEST_GENERATION
+
+    def test_update_trial_rebuckets_generation(self) -> None:
+        new_generation = MAX_TEST_GENERATION + 1
+        ray.get(
+            self.trial_manager.update_trial.remote(0, {"generation": new_generation}),
+        )
+
+        assert self.get_min_iteration_ids() == set(range(1, GROUP_SIZE))
+
+        trials = ray.get(self.trial_manager.get_nlargest_iteration_trials.remote(1))
+        assert trials[0].id == 0
+        assert trials[0].generation == new_generation
+
+    def test_acquire_for_cpu_returns_none_when_empty(self) -> None:
+        acquired = {
+            ray.get(
+                self.trial_manager.acquire_pending_trial_for_cpu.remote(
+                    WORKER_ID,
+                    CPU_WORKER_NUM,
+                ),
+            ).id
+            for _ in range(NUM_TRIALS)
+        }
+        assert acquired == set(range(NUM_TRIALS))
+
+        assert (
+            ray.get(
+                self.trial_manager.acquire_pending_trial_for_cpu.remote(
+                    WORKER_ID,
+                    CPU_WORKER_NUM,
+                ),
+            )
+            is None
+        )
+        assert self.get_min_iteration_ids() == set()
+        assert not ray.get(self.trial_manager.has_pending_trials.remote())
+
+
+if __name__ == "__main__":
+    unittest.main()